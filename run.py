@@ -16,17 +16,33 @@ private IP assigned to my laptop in my home network.
 NOTE: You may need to create an inbound firewall rule to allow incoming network 
 traffic from local devices (on your private network) to the specified port on your 
 machine.
+
+The app is served by one worker process per CPU core by default (set 'SERVER_WORKERS' 
+to override), using the uvloop event loop (not available on Windows) and the httptools 
+HTTP parser. Each worker runs model inference on its share of the CPUs (CPU count // 
+'SERVER_WORKERS' threads, minimum 1; set 'COMPUTE_WORKERS' to override). Uvicorn's 
+access log is disabled; the app logs each request itself.
+
+NOTE: os.cpu_count() reports the host's CPUs and ignores container (cgroup) CPU 
+limits. When running in a CPU-limited container, set 'SERVER_WORKERS' to the 
+number of CPUs the container can actually use.
 """
 
 import os
+import sys
 
 import uvicorn
 
-    
-uvicorn.run(
-    "src.app:app", 
-    host=os.getenv("SERVER_IP", "127.0.0.1"), 
-    port=os.getenv("SERVER_PORT", 8000), 
-    reload=False,
-    log_config=None
-)
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "src.app:app", 
+        host=os.getenv("SERVER_IP", "127.0.0.1"), 
+        port=int(os.getenv("SERVER_PORT", 8000)), 
+        workers=int(os.getenv("SERVER_WORKERS", os.cpu_count())),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=False,
+        log_config=None,
+        access_log=False
+    )
@@ -1,17 +1,21 @@
-import traceback
-from datetime import datetime
+import asyncio
+import base64
+import binascii
+import logging
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import (
     FastAPI, 
     HTTPException, 
     Request, 
-    Depends, 
     status
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi.openapi.utils import get_openapi
 
 from src.schemas import (
     ModelRequest, 
@@ -23,13 +27,15 @@ from src.schemas import (
 )
 from src.config import (
     logger,
+    logging_client,
     model,
     data_client,
     CORRECT_USERNAME,
     CORRECT_PASSWORD,
     HOST,
     PORT,
-    data_collection_executor
+    BATCH_MAX_SIZE,
+    COMPUTE_WORKERS
 )
 
 
@@ -37,64 +43,239 @@ from src.config import (
 async def lifespan(app: FastAPI):
     """Startup / shutdown processes."""
 
-    # startup
+    # startup; the clients are already running on first launch, but are 
+    # restarted if the app is launched again after a shutdown
+    logging_client.start()
+    data_client.start()
     logger.info("Launching app...")
-    logger.info(f"App running on http://{HOST}:{PORT}")
+    logger.info("App running on http://%s:%s", HOST, PORT)
+    app.state.compute_executor = ThreadPoolExecutor(
+        max_workers=COMPUTE_WORKERS, 
+        thread_name_prefix="wtp"
+    )
+    app.state.inference_queue = asyncio.Queue()
+    batcher = asyncio.create_task(
+        batch_predictions(app.state.inference_queue, app.state.compute_executor)
+    )
     logger.info("Awaiting requests...")
 
     yield
 
     # shutdown
     logger.info("Shutting down app...")
+    logger.info("Stopping inference batcher...")
+    # stop taking new batches, but let in-flight batches finish so their 
+    # requests still get predictions
+    batcher.cancel()
+    await asyncio.gather(batcher, *_batch_tasks, return_exceptions=True)
+    logger.info("Shutting down executors...")
+    app.state.compute_executor.shutdown(wait=True)
     logger.info("Closing DataCollectionClient...")
     data_client.close()
-    logger.info(f"DataCollectionClient closed successfully.")
+    logger.info("DataCollectionClient closed successfully.")
     logger.info("App shut down.")
+    logging_client.close()
 
 
 app = FastAPI(
     title="Logistic Regression Model",
     summary="Returns predicted probabilities.",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-security = HTTPBasic()
+# ---------- SUPPORT FUNCS ----------
 
 
-# ---------- SUPPORT FUNCS ----------
+class AuthLogMiddleware:
+    """
+    ASGI middleware that logs each endpoint call and enforces HTTP Basic auth.
+
+    The expected Basic token is built once, so authenticating a request is a 
+    case-insensitive check of the scheme plus a single constant-time 
+    comparison of the token, with no dependency resolution. Requests with 
+    invalid credentials are rejected with a 401 before reaching the router. 
+    Paths in `exempt_paths` (e.g., the API docs) are passed through untouched.
+
+    Parameters
+    ----------
+    app : ASGI app
+        The wrapped application.
+    username : str
+        Expected username.
+    password : str
+        Expected password.
+    exempt_paths : set of str
+        Paths served without logging or authentication.
+    """
 
+    def __init__(self, app, username: str, password: str, exempt_paths: set):
+        self.app = app
+        self.exempt_paths = exempt_paths
+        self._expected_token = base64.b64encode(f"{username}:{password}".encode())
 
-def log_request(request: Request):
-    """Logs the endpoint being called."""
-    
-    logger.info(f"Endpoint called: {request.method} {request.url.path}")
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        logger.info("Endpoint called: %s %s", scope["method"], scope["path"])
+
+        authorization = b""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+
+        # parsed like FastAPI's HTTPBasic: the scheme name is case-insensitive
+        scheme, _, token = authorization.partition(b" ")
+        token_ok = secrets.compare_digest(token.strip(), self._expected_token)
+
+        if not (scheme.lower() == b"basic" and token_ok):
+            logger.error("User '%s' cannot be authenticated.", _basic_username(authorization))
+            logger.error("Response status: 401")
+            response = ORJSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "Invalid credentials."},
+                headers={"WWW-Authenticate": "Basic"}
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+def _basic_username(authorization: bytes) -> str:
+    """Extract the username from a Basic `Authorization` header, for logging."""
+
+    scheme, _, token = authorization.partition(b" ")
+    if scheme.lower() != b"basic":
+        return ""
+    try:
+        return base64.b64decode(token).decode().partition(":")[0]
+    except (binascii.Error, UnicodeDecodeError):
+        return ""
 
 
-def authenticate(credentials: HTTPBasicCredentials = Depends(security)):
+def custom_openapi() -> dict:
     """
-    Authenticate the user based on the provided credentials.
+    Generate the OpenAPI schema, declaring HTTP Basic auth on the endpoints.
 
-    This function checks if the provided username and password match
-    the expected values. If the credentials are invalid, an HTTP 401
-    Unauthorized error is raised.
+    Authentication is handled by `AuthLogMiddleware` rather than a FastAPI 
+    security dependency, so the security scheme is added to the schema here.
     """
 
-    if credentials.username != CORRECT_USERNAME or credentials.password != CORRECT_PASSWORD:
-        logger.error(f"User '{credentials.username}' cannot be authenticated.")
-        logger.error("Response status: 401")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid credentials.",
-            headers={"WWW-Authenticate": "Basic"},
+    if app.openapi_schema:
+        return app.openapi_schema
+
+    schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        summary=app.summary,
+        routes=app.routes
+    )
+    schema["components"]["securitySchemes"] = {
+        "HTTPBasic": {"type": "http", "scheme": "basic"}
+    }
+    for path in schema["paths"].values():
+        for operation in path.values():
+            operation["security"] = [{"HTTPBasic": []}]
+
+    app.openapi_schema = schema
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
+app.add_middleware(
+    AuthLogMiddleware,
+    username=CORRECT_USERNAME,
+    password=CORRECT_PASSWORD,
+    exempt_paths={
+        app.openapi_url, 
+        app.docs_url, 
+        app.redoc_url, 
+        app.swagger_ui_oauth2_redirect_url
+    }
+)
+
+
+_batch_tasks = set()
+
+
+async def batch_predictions(queue: asyncio.Queue, executor: ThreadPoolExecutor):
+    """
+    Background task that groups concurrent inference requests into a single 
+    `model.predict()` call.
+
+    Each queue item is a `(data, future)` pair. A batch is dispatched as soon 
+    as a compute thread is free, taking whatever is already queued (up to 
+    `BATCH_MAX_SIZE` requests), so a lone request is never held back. While 
+    all `COMPUTE_WORKERS` threads are busy, new requests accumulate in the 
+    queue and go out together in the next batch. The batch is scored in the 
+    compute pool, and each request's slice of the predictions is set on its 
+    future.
+    """
+
+    slots = asyncio.Semaphore(COMPUTE_WORKERS)
+
+    while True:
+        batch = [await queue.get()]
+        await slots.acquire()
+
+        while len(batch) < BATCH_MAX_SIZE:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        task = asyncio.create_task(_predict_batch(batch, executor))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
+        task.add_done_callback(lambda _: slots.release())
+
+
+async def _predict_batch(batch: list, executor: ThreadPoolExecutor):
+    """
+    Score a batch of requests in one call and resolve each request's future.
+
+    Stacking the requests' features happens inside `model.predict_batch()`, 
+    in the compute pool, so the event loop never touches individual values.
+    """
+
+    try:
+        loop = asyncio.get_running_loop()
+        preds = await loop.run_in_executor(
+            executor, 
+            model.predict_batch, 
+            [data for data, _ in batch]
         )
+    except Exception as error:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+        return
+
+    if len(batch) == 1:
+        future = batch[0][1]
+        if not future.done():
+            future.set_result(preds)
+        return
+
+    start = 0
+    for data, future in batch:
+        end = start + len(data[model.feature_names[0]])
+        if not future.done():
+            future.set_result(preds[start:end])
+        start = end
 
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, 
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Custom handler for validation errors.
     
@@ -113,8 +294,8 @@ async def validation_exception_handler(
             - "expected_type": The type of the value that was expected.
     """
 
-    logger.error(f"Validation error occurred for request {request.method} {request.url}")
-    logger.error(f"Request body: {await request.json()}")
+    logger.error("Validation error occurred for request %s %s", request.method, request.url)
+    logger.error("Request body: %s", exc.body)
     logger.error("Response status: 422")
 
     content = {
@@ -130,9 +311,9 @@ async def validation_exception_handler(
         ]
     }
     
-    logger.error(f"Response payload: {content}")
+    logger.error("Response payload: %s", content)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content=content
     )
@@ -157,29 +338,19 @@ tags = ["Endpoints"]
 
 
 @app.get("/check", response_model=HealthCheck, responses=standard_responses, tags=tags)
-async def check(
-    request: Request, 
-    _ = Depends(log_request), 
-    creds: str = Depends(authenticate)
-):
+async def check():
     """Check if the server is running."""
 
     try:
         response = {"status": "active"}
 
         logger.info("Response status: 200")
-        logger.info(f"Response payload: {response}")
+        logger.info("Response payload: %s", response)
 
-        return JSONResponse(
-            status_code=200,
-            content=response
-        )
+        return response
     
-    except Exception as error:
-        error_trace = traceback.format_exc()
-
-        logger.error(f"Check failed.")
-        logger.error(f"Error message: {str(error)}\n\n{error_trace}")
+    except Exception:
+        logger.exception("Check failed.")
         logger.error("Response status: 500")
 
         raise HTTPException(
@@ -188,12 +359,20 @@ async def check(
         )
 
 
-@app.post("/inference", response_model=ModelResponse, responses=standard_responses, tags=tags)
+# the response is built here and already matches ModelResponse, so it's only 
+# documented in the OpenAPI spec rather than re-validated on every request
+inference_responses = {
+    200: {
+        "model": ModelResponse
+    },
+    **standard_responses
+}
+
+
+@app.post("/inference", response_model=None, responses=inference_responses, tags=tags)
 async def inference(
     payload: ModelRequest, 
-    request: Request, 
-    _ = Depends(log_request),
-    creds: str = Depends(authenticate)
+    request: Request
 ):
     """
     Model inference on input data. Inference can be performed on 
@@ -202,14 +381,22 @@ async def inference(
     
     try:
 
-        logger.info(f"Request payload: {payload.dict()}")
+        # only dump the payload if the record will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Request payload: %s", payload.model_dump())
 
-        request_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # epoch ns; the DataCollectionClient formats it off the request path
+        request_time = time.time_ns()
 
-        # pass data to model
+        # shallow copy of the validated fields; avoids re-serializing the lists
+        data = dict(payload.data)
+
+        # pass data to the batcher, which scores it in the compute pool 
+        # alongside any other in-flight requests
         logger.info("Passing payload to model...")
-        data = payload.data.dict()
-        preds = model.predict(data)
+        future = asyncio.get_running_loop().create_future()
+        await request.app.state.inference_queue.put((data, future))
+        preds = await future
 
         # log request/response for monitoring
         logger.info("Capturing payload and model predictions...")
@@ -217,8 +404,8 @@ async def inference(
         data["identifier"] = payload.identifier
         data["request_time"] = request_time
 
-        # collect data in separate thread
-        data_collection_executor.submit(data_client.collect, data)
+        # enqueue for the DataCollectionClient's writer thread; never waits on disk
+        data_client.collect(data)
 
         logger.info("Returning predictions...")
 
@@ -227,19 +414,14 @@ async def inference(
             "predictions": preds
         }
 
-        logger.info(f"Response status: 200")
-        logger.info(f"Response payload: {response}")
+        logger.info("Response status: 200")
+        logger.info("Response payload: %s", response)
 
-        return JSONResponse(
-            status_code=200,
-            content=response
-        )
+        return response
     
-    except Exception as error:
-        error_trace = traceback.format_exc()
-
-        logger.error(f"Inference failed.")
-        logger.error(f"Error message: {str(error)}\n\n{error_trace}")
+    except Exception:
+        # traceback is attached to the record and only formatted by the handler
+        logger.exception("Inference failed.")
         logger.error("Response status: 500")
 
         raise HTTPException(
@@ -1,8 +1,12 @@
 import os
+import io
 import csv
+import queue
+import threading
 from typing import List, Callable
-from datetime import datetime
+from datetime import date, datetime
 import logging
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 from src.model import transform_data
 
@@ -13,27 +17,48 @@ class DataCollectionClient:
     to CSV files.
 
     Each class instantiation creates a CSV file in the specified `storage_dir`
-    with the date + time of instantiation in the file name. The idea is to create 
-    a new CSV file for each app session to better separate requests.
+    with the date + time of instantiation and the process ID in the file name. The 
+    idea is to create a new CSV file for each app session (and each worker process) 
+    to better separate requests and avoid workers writing to the same file. When the 
+    date changes, the client rolls over to a new file (with a new timestamp).
 
     This is essentially a lightweight local filesystem 'database'. It is an in-memory + 
     local filesystem solution, so it's not a fault-tolerant storage system like a true 
     database.
 
+    Writes follow a producer-consumer model: `collect()` only places data on a 
+    bounded queue without blocking, and a single consumer thread owned by the client 
+    drains the queue and writes to the CSV file. If the queue is full (e.g., the disk 
+    is stalled), the data is dropped and an error is logged, so memory use stays 
+    bounded and callers never wait on disk. Callers never touch the file directly, so 
+    `collect()` is safe to call from multiple threads. All filesystem calls, including 
+    file rollover, happen on the consumer thread.
+
+    Rows are formatted into an in-memory batch with `csv.writer.writerows()` and 
+    written to disk with a single `os.write()` once the batch holds `buffer` 
+    collected batches or reaches `buffer_bytes`, so the per-row cost is pure 
+    string formatting and each flush is exactly one syscall.
+
     Attributes
     ----------
     columns : list of str
         The list of column names to be used in the CSV file.
     storage_path : str
-        The full path to the storage file, including the timestamp.
+        The full path to the current storage file, including the timestamp.
 
     Methods
     -------
+    start()
+        Open a new CSV file and start the consumer thread (no-op if the client 
+        is already running).
     collect(data)
-        Collect data in file buffer. Flushes buffered data to disk when the buffer size 
-        exceeds input parameter `buffer`.
+        Queue data for collection. The consumer thread writes it to the file 
+        buffer and flushes buffered data to disk when the buffer is full (see 
+        `buffer` and `buffer_bytes`). An integer `request_time` (epoch 
+        nanoseconds) is formatted as "%Y-%m-%d %H:%M:%S" just before writing.
     close()
-        Flush buffer and close file.
+        Drain the queue, flush buffer and close file (no-op if the client is 
+        already closed).
     """
 
     def __init__(
@@ -42,7 +67,9 @@ class DataCollectionClient:
         storage_dir: str,
         logger: logging.Logger,
         transform_func: Callable = transform_data,
-        buffer: int = 5
+        buffer: int = 5,
+        buffer_bytes: int = 65536,
+        queue_size: int = 1000
     ):
         """
         Initializes the client with the provided parameters and prepares a CSV 
@@ -61,30 +88,77 @@ class DataCollectionClient:
             `transform_data`). This must be specific to the model being 
             monitored.
         buffer : int, default=5
-            Max buffer size before flushing buffer to disk.
+            Max number of buffered batches (i.e., `collect()` calls) before 
+            flushing buffer to disk.
+        buffer_bytes : int, default=65536
+            Max size of the buffer, in characters, before flushing buffer to 
+            disk regardless of the number of batches.
+        queue_size : int, default=1000
+            Max number of pending `collect()` calls. Once full, data passed to 
+            `collect()` is dropped until the consumer thread catches up.
         """
 
         self.columns = columns
 
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        self.storage_path = os.path.join(
-            storage_dir, 
-            f"monitoring_data_{timestamp}.csv"
-        )
-
+        self._storage_dir = storage_dir
         self._logger = logger
         self._transform = transform_func
         self._buffer = buffer
+        self._buffer_bytes = buffer_bytes
         self._buffer_size = 0
-        self._file = open(self.storage_path, mode="a", newline="")
-        self._writer = csv.writer(self._file)
+        self._batch = io.StringIO()
+        self._writer = csv.writer(self._batch)
 
-        self._writer.writerow(columns)
-        self._file.flush()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._consumer = None
+        self._running = False
+        self.start()
+
+    def start(self):
+        """
+        Open a new CSV file and start the consumer thread, if the client isn't 
+        already running.
+        """
+
+        if not self._running:
+            self._open_file()
+            self._consumer = threading.Thread(
+                target=self._consume, 
+                name="data-collection", 
+                daemon=True
+            )
+            self._consumer.start()
+            self._running = True
 
     def collect(self, data: dict):
         """
-        Collect the observations and predictions in the CSV file.
+        Queue the observations and predictions to be written to the CSV file.
+
+        Parameters
+        ----------
+        data : dict
+            A dictionary containing the data to be logged. The keys 
+            should correspond to the feature names, and the values 
+            should be lists of observations.
+        """
+
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            self._logger.error("DataCollectionClient queue is full. Dropping collected data.")
+
+    def _consume(self):
+        """Consumer loop. Writes queued data until a `None` sentinel is received."""
+
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            self._write(data)
+
+    def _write(self, data: dict):
+        """
+        Write the observations and predictions to the CSV file.
 
         Parameters
         ----------
@@ -100,38 +174,115 @@ class DataCollectionClient:
         """
 
         try:
+            if date.today() != self._date:
+                self._logger.info("Date changed. DataCollectionClient rolling over to a new file.")
+                self._rotate()
+
+            # format into a shallow copy; the caller's dict may still be 
+            # referenced elsewhere (e.g., by a queued log record)
+            request_time = data.get("request_time")
+            if isinstance(request_time, int):
+                data = {
+                    **data, 
+                    "request_time": datetime.fromtimestamp(
+                        request_time // 1_000_000_000
+                    ).isoformat(sep=" ", timespec="seconds")
+                }
+
             obs = len(data[self.columns[0]])
             new_data = self._transform(data, self.columns, obs)
 
-            for data_row in new_data:
-                self._writer.writerow(data_row)
-                self._buffer_size += 1
+            self._writer.writerows(new_data)
+            self._buffer_size += 1
 
-            if self._buffer_size >= self._buffer:
+            if self._buffer_size >= self._buffer or self._batch.tell() >= self._buffer_bytes:
                 self._logger.info("DataCollectionClient buffer is full. Flushing data to disk.")
-                self._file.flush()
-                self._buffer_size = 0
+                self._flush()
 
         except Exception as e:
             self._logger.error(f"Error collecting data: {e}")
 
+    def _open_file(self):
+        """Create a new timestamped CSV file and write the header row to it."""
+
+        now = datetime.now()
+        self._date = now.date()
+        self.storage_path = os.path.join(
+            self._storage_dir, 
+            f"monitoring_data_{now:%Y-%m-%d_%H-%M-%S}_{os.getpid()}.csv"
+        )
+        self._fd = os.open(
+            self.storage_path, 
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND, 
+            0o644
+        )
+
+        # a restart within the same second reopens the same file
+        if os.fstat(self._fd).st_size == 0:
+            self._writer.writerow(self.columns)
+            self._flush()
+
+    def _rotate(self):
+        """Flush pending rows to the current file, close it and open a new one."""
+
+        self._flush()
+        os.close(self._fd)
+        self._open_file()
+
+    def _flush(self):
+        """Write the batched rows to disk in a single call and reset the batch."""
+
+        view = memoryview(self._batch.getvalue().encode())
+        while view:
+            view = view[os.write(self._fd, view):]
+
+        self._batch.seek(0)
+        self._batch.truncate()
+        self._buffer_size = 0
+
     def close(self):
-        """Flush remaining buffer and close the file."""
+        """Drain the queue, flush remaining buffer and close the file."""
 
+        if not self._running:
+            return
+
+        self._running = False
         try:
-            self._file.flush()
-            self._file.close()
+            self._queue.put(None)
+            self._consumer.join()
+            self._flush()
+            os.close(self._fd)
         except Exception as e:
             self._logger.error(f"Error closing DataCollectionClient: {e}")
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records as-is.
+
+    The stock `prepare()` formats the record (merging args and rendering any 
+    traceback) on the calling thread so the record can be pickled. The queue 
+    here is in-process, so formatting is left to the listener's handlers on 
+    the background thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class LoggingClient:
     """
     A client class to handle all logging. This class abstracts away all logging 
     configuration operations and manages log storage.
 
-    A FileHandler is used by default to stream logs to a .log file. A StreamHandler 
-    can be optionally added.
+    A TimedRotatingFileHandler is used by default to stream logs to a .log file, 
+    rolling over at midnight. A StreamHandler can be optionally added. The log file 
+    name includes the process ID, so each app worker process writes to its own file.
+
+    The logger itself only has a QueueHandler attached, so logging calls just enqueue 
+    the (unformatted) record. A QueueListener running in a background thread passes 
+    records to the file / stream handlers, keeping formatting and disk and console I/O 
+    (including log file rollover) off the calling thread.
 
     Attributes
     ----------
@@ -150,6 +301,14 @@ class LoggingClient:
     ---------
     logger
         Returns the logger instance.
+
+    Methods
+    -------
+    start()
+        Start the background listener (no-op if it's already running).
+    close()
+        Stop the background listener, flushing any queued records (no-op if it's 
+        already stopped).
     """
 
     def __init__(
@@ -185,10 +344,14 @@ class LoggingClient:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         self.storage_path = os.path.join(
             storage_dir, 
-            f"app_{timestamp}.log"
+            f"app_{timestamp}_{os.getpid()}.log"
         )
 
+        self._queue = queue.Queue(-1)
+        self._listener = None
+        self._running = False
         self._logger = self._create_logger()
+        self.start()
 
     @property
     def logger(self) -> logging.Logger:
@@ -202,12 +365,32 @@ class LoggingClient:
         """
         return self._logger
 
+    def start(self):
+        """
+        Start the background listener, if it isn't already running. Records logged 
+        while the listener is stopped stay queued until it is started again.
+        """
+
+        if not self._running:
+            self._listener.start()
+            self._running = True
+
+    def close(self):
+        """Stop the background listener, processing any records left in the queue."""
+
+        if self._running:
+            self._listener.stop()
+            self._running = False
+
     def _create_logger(self) -> logging.Logger:
         """
         Creates a logger with a file handler (for logging to a file) and an optional
         stream handler (for logging to the console). Handlers are set to the specified 
         logging level and use the provided format.
 
+        The handlers are attached to a QueueListener; the logger only gets a 
+        QueueHandler feeding the listener's queue.
+
         Returns
         -------
         logging.Logger
@@ -216,7 +399,7 @@ class LoggingClient:
         logger = logging.getLogger(self.name)
         logger.setLevel(self.level)
 
-        fh = logging.FileHandler(self.storage_path)
+        fh = TimedRotatingFileHandler(self.storage_path, when="midnight")
         fh.setLevel(self.level)
 
         formatter = logging.Formatter(
@@ -225,12 +408,19 @@ class LoggingClient:
         )
         fh.setFormatter(formatter)
 
-        logger.addHandler(fh)
+        handlers = [fh]
 
         if self.console_logs:
             sh = logging.StreamHandler()
             sh.setLevel(self.level)
             sh.setFormatter(formatter)
-            logger.addHandler(sh)
+            handlers.append(sh)
+
+        self._listener = QueueListener(
+            self._queue, 
+            *handlers, 
+            respect_handler_level=True
+        )
+        logger.addHandler(_DeferredQueueHandler(self._queue))
 
         return logger
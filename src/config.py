@@ -7,12 +7,15 @@ Initialize / instantiate all supporting objects for the app.
     4. Environment Variables
         a. API Credentials
         b. Server and Port for serving
-    5. ThreadPoolExecutor for handling all data collection tasks in a 
-       single, separate thread
+        c. Inference batching limit (max requests per batch)
+        d. Compute threads per worker process (COMPUTE_WORKERS), sized to 
+           this worker process's share of the CPUs. The compute executor 
+           itself is created per app lifespan in app.py. Disk I/O for data 
+           collection happens on the DataCollectionClient's own writer 
+           thread, so it never competes with inference.
 """
 
 import os
-from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
@@ -20,14 +23,17 @@ from src.model import ModelWrapper
 from src.clients import DataCollectionClient, LoggingClient
 
 
-_logging_client = LoggingClient(
+logging_client = LoggingClient(
     name=__file__,
     storage_dir="data/logs",
     console_logs=True
 )
-logger = _logging_client.logger
+logger = logging_client.logger
 
-model = ModelWrapper(path="models/model.pkl")
+model = ModelWrapper(
+    path="models/model.pkl",
+    onnx_path="models/model.onnx"
+)
 
 data_client = DataCollectionClient(
     columns=model.feature_names + [
@@ -39,8 +45,6 @@ data_client = DataCollectionClient(
     logger=logger
 )
 
-data_collection_executor = ThreadPoolExecutor(max_workers=1)
-
 load_dotenv()
 
 CORRECT_USERNAME = os.environ["AUTH_UN"]
@@ -48,3 +52,18 @@ CORRECT_PASSWORD = os.environ["AUTH_PW"]
 
 HOST = os.getenv("SERVER_IP", "127.0.0.1")
 PORT = os.getenv("SERVER_PORT", 8000)
+
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", 32))
+
+# each uvicorn worker gets its share of the CPUs, rather than one thread per 
+# CPU in every worker; see run.py for the SERVER_WORKERS default
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", os.cpu_count()))
+if SERVER_WORKERS < 1:
+    raise ValueError(f"SERVER_WORKERS must be at least 1, got {SERVER_WORKERS}.")
+
+COMPUTE_WORKERS = int(os.getenv(
+    "COMPUTE_WORKERS", 
+    max(1, os.cpu_count() // SERVER_WORKERS)
+))
+if COMPUTE_WORKERS < 1:
+    raise ValueError(f"COMPUTE_WORKERS must be at least 1, got {COMPUTE_WORKERS}.")
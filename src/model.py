@@ -1,7 +1,15 @@
+import os
 import pickle as pkl
-from typing import List, Dict, Iterable
+import threading
+from itertools import islice, repeat
+from typing import List, Dict, Iterable, Iterator, Optional
 
-import pandas as pd
+import numpy as np
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
 
 
 class ModelWrapper:
@@ -13,13 +21,32 @@ class ModelWrapper:
     format) into a Numpy array before passing it to the model (the wrapped 
     model's `predict()` method expects a Numpy array as input).
 
+    If an ONNX export of the model is available (and `onnxruntime` is 
+    installed), inference runs through an ONNX Runtime session instead of 
+    the pickled model's `predict()`. The pickled model is always loaded, as 
+    it provides the feature names, and serves as the fallback.
+
+    Inference runs in single precision: the fitted coefficients are cast to 
+    float32 at load time and inputs are copied into a float32 array. Double 
+    precision buys nothing for a logistic regression and doubles the memory 
+    traffic. An ONNX model declaring a double input is fed float64 instead.
+
     Parameters
     ----------
     path : str
         File path to the fitted model object (pickled model file).
+    onnx_path : str, optional
+        File path to an ONNX export of the same model.
+    max_buffer_rows : int, default=4096
+        Largest batch (in rows) kept in each thread's reusable input buffer.
     """
 
-    def __init__(self, path: str):
+    def __init__(
+        self, 
+        path: str, 
+        onnx_path: Optional[str] = None, 
+        max_buffer_rows: int = 4096
+    ):
         """
         Initializes the model wrapper by loading the model from the provided 
         file path.
@@ -28,19 +55,52 @@ class ModelWrapper:
         ----------
         path : str
             File path to the fitted model object.
+        onnx_path : str, optional
+            File path to an ONNX export of the model. Its first input must 
+            accept the feature matrix, and its first output must be the 
+            predicted values. Ignored if the file doesn't exist or 
+            `onnxruntime` isn't installed.
+        max_buffer_rows : int, default=4096
+            Largest batch (in rows) kept in each thread's reusable input 
+            buffer. Larger batches get a one-off array, so a single huge 
+            request doesn't pin its memory for the life of the thread.
         """
         with open(path, "rb") as file:
             self.model = pkl.load(file)
 
+        if isinstance(getattr(self.model, "betas", None), np.ndarray):
+            self.model.betas = self.model.betas.astype(np.float32)
+
+        self._session = None
+        self._dtype = np.float32
+        if onnx_path is not None and ort is not None and os.path.exists(onnx_path):
+            self._session = ort.InferenceSession(
+                onnx_path, 
+                providers=["CPUExecutionProvider"]
+            )
+            model_input = self._session.get_inputs()[0]
+            self._input_name = model_input.name
+            if model_input.type == "tensor(double)":
+                self._dtype = np.float64
+
         self.feature_names = [
             feat.replace(" ", "_") for feat in self.model.variable_names
         ]
+        self._feat_keys = tuple(self.feature_names)
+        self._tls = threading.local()
+        self._max_buffer_rows = max_buffer_rows
 
     def predict(self, data: Dict[str, List[float]]) -> List[float]:
         """
         Perform inference on a dataset by converting the input data to a 
         numpy array and passing it to the model's `predict()` method.
 
+        Columns are copied directly into a preallocated array in the model's 
+        feature order, avoiding the overhead of building a DataFrame. Each 
+        thread keeps its own buffer, grown to the largest batch it has seen 
+        (up to `max_buffer_rows`), so repeated calls don't allocate a new 
+        array.
+
         Parameters
         ----------
         data : dict of {str: list of float}
@@ -63,18 +123,72 @@ class ModelWrapper:
             A list of predicted values. The length of this list will match 
             the length of the input feature arrays.
         """
-        data_matrix = pd.DataFrame(data).to_numpy()
-        return self.model.predict(data_matrix).flatten().tolist()
+        return self.predict_batch([data])
+
+    def predict_batch(self, batch: List[Dict[str, List[float]]]) -> List[float]:
+        """
+        Perform inference on several datasets in a single model call.
+
+        Each dataset's columns are copied into consecutive rows of the 
+        preallocated array (stacking the datasets vertically), so no 
+        intermediate combined lists are built.
+
+        Parameters
+        ----------
+        batch : list of dict of {str: list of float}
+            Datasets to score, each in the format accepted by `predict()`.
+
+        Returns
+        -------
+        list of float
+            Predicted values for all datasets, in order. The predictions for 
+            each dataset are a contiguous slice of this list.
+        """
+        sizes = [len(data[self._feat_keys[0]]) for data in batch]
+        n = sum(sizes)
+
+        if n > self._max_buffer_rows:
+            # oversized batch; don't grow the thread's buffer to hold it
+            data_matrix = np.empty((n, len(self._feat_keys)), dtype=self._dtype)
+        else:
+            buf = getattr(self._tls, "buf", None)
+            if buf is None or buf.shape[0] < n:
+                buf = np.empty((max(n, 32), len(self._feat_keys)), dtype=self._dtype)
+                self._tls.buf = buf
+
+            # leading rows of a C-ordered array are a contiguous view
+            data_matrix = buf[:n]
+        start = 0
+        for data, size in zip(batch, sizes):
+            rows = data_matrix[start:start + size]
+            for j, key in enumerate(self._feat_keys):
+                rows[:, j] = data[key]
+            start += size
+
+        if self._session is not None:
+            preds = self._session.run(None, {self._input_name: data_matrix})[0]
+        else:
+            preds = self.model.predict(data_matrix)
+
+        return preds.ravel().tolist()
 
 
 def transform_data(
         data: dict, 
         feature_order: Iterable[str], 
         observations: int
-) -> List[List[str]]:
+) -> Iterator[tuple]:
     """
     Custom function used to transform the API request payload into 
-    lists of string values, to be written to a CSV file.
+    rows of values, to be written to a CSV file.
+
+    Columns are looked up once and walked row-wise with `zip()`. Scalar 
+    values (e.g., a single request time) are repeated for every row. Rows 
+    are yielded lazily and values are left as-is; `csv.writer.writerows()` 
+    consumes the iterator and converts values to strings in C.
+
+    Every list column must hold exactly `observations` values; otherwise 
+    `zip()` would silently drop or misalign rows, so a ValueError is raised.
 
     Parameters
     ----------
@@ -87,8 +201,8 @@ def transform_data(
 
     Returns
     -------
-    List[List[str]]
-        List of 'rows' for the CSV file.
+    Iterator[tuple]
+        Iterator of 'rows' for the CSV file.
 
     Example
     -------
@@ -99,18 +213,22 @@ def transform_data(
         "mean_area": [523.45, 600.34, 490.12]
     }
 
-    >>> _tranform(data, data.keys(), 3)
+    >>> list(transform_data(data, data.keys(), 3))
 
     [
-        [12.34, 19.54, 78.12, 523.45], 
-        [15.67, 17.33, 85.67, 600.34], 
-        [10.11, 18.45, 70.22, 490.12]
+        (12.34, 19.54, 78.12, 523.45), 
+        (15.67, 17.33, 85.67, 600.34), 
+        (10.11, 18.45, 70.22, 490.12)
     ]
 
     """
-    return [
-        [
-            str(data[feature][obs]) for feature in feature_order
-        ] 
-        for obs in range(observations)
+    columns = [
+        data[feature] if isinstance(data[feature], list) else repeat(data[feature])
+        for feature in feature_order
     ]
+    for feature, column in zip(feature_order, columns):
+        if isinstance(column, list) and len(column) != observations:
+            raise ValueError(
+                f"Column '{feature}' has {len(column)} values, expected {observations}."
+            )
+    return islice(zip(*columns), observations)
@@ -1,13 +1,12 @@
 from typing import List, Literal, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, model_validator
 
 
 class ModelFeatures(BaseModel):
     """Model features."""
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
     mean_radius: List[float]
     mean_texture: List[float]
@@ -20,16 +19,34 @@ class ModelFeatures(BaseModel):
     mean_symmetry: List[float]
     mean_fractal_dimension: List[float]
 
+    @model_validator(mode="after")
+    def check_lengths(self) -> "ModelFeatures":
+        """
+        Reject ragged input. Requests are concatenated into shared batches, so 
+        a short feature list would shift rows into another request.
+        """
+
+        if len({len(values) for _, values in self}) > 1:
+            raise ValueError("All feature lists must be the same length.")
+        return self
+
 
 class ModelRequest(BaseModel):
     """Base API request."""
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
     identifier: List[str]
     data: ModelFeatures
 
+    @model_validator(mode="after")
+    def check_identifiers(self) -> "ModelRequest":
+        """Require one identifier per observation."""
+
+        if len(self.identifier) != len(self.data.mean_radius):
+            raise ValueError("There must be one identifier per observation.")
+        return self
+
 
 class ModelResponse(BaseModel):
     """Base model response."""
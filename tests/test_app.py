@@ -4,6 +4,10 @@ before executing this script.
 """
 
 import os
+import math
+import base64
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 from dotenv import load_dotenv
@@ -62,6 +66,81 @@ def test_unauthorized():
         print("Auth test passed:", response.status_code, response.text)
 
 
+def test_lowercase_scheme():
+    token = base64.b64encode(f"{un}:{pw}".encode()).decode()
+    headers = {"Authorization": f"basic {token}"}
+    response = requests.get(f"{BASE_URL}/check", headers=headers)
+    if response.status_code == 200:
+        print("Lowercase scheme test passed:", response.json())
+    else:
+        print("Lowercase scheme test failed:", response.status_code, response.text)
+
+
+def test_missing_auth():
+    response = requests.get(f"{BASE_URL}/check")
+    if response.status_code == 401:
+        print("Missing auth test passed:", response.status_code, response.text)
+    else:
+        print("Missing auth test failed:", response.status_code)
+
+
+def test_ragged_input():
+    ragged_data = {
+        "identifier": test_data["identifier"],
+        "data": {**test_data["data"], "mean_area": [523.45, 600.34]}
+    }
+    response = requests.post(f"{BASE_URL}/inference", json=ragged_data, auth=auth)
+    if response.status_code == 422:
+        print("Ragged input test passed:", response.status_code, response.text)
+    else:
+        print("Ragged input test failed:", response.status_code, response.text)
+
+
+def _subset(rows: list) -> dict:
+    """Build a request from the given rows of `test_data`."""
+
+    return {
+        "identifier": [test_data["identifier"][i] for i in rows],
+        "data": {
+            feature: [values[i] for i in rows] 
+            for feature, values in test_data["data"].items()
+        }
+    }
+
+
+def test_concurrent_inference():
+    # requests of different sizes, sent at once so the app batches them 
+    # together; each must get back its own predictions
+    payloads = [_subset(rows) for rows in ([0], [1, 2], [2, 0, 1], [1]) * 8]
+
+    expected = [
+        requests.post(f"{BASE_URL}/inference", json=payload, auth=auth).json()
+        for payload in payloads
+    ]
+
+    def post(payload):
+        return requests.post(f"{BASE_URL}/inference", json=payload, auth=auth).json()
+
+    with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+        results = list(executor.map(post, payloads))
+
+    # batch shape can change the last bits of a float, so compare approximately
+    matched = all(
+        result["identifier"] == exp["identifier"] 
+        and len(result["predictions"]) == len(exp["predictions"])
+        and all(
+            math.isclose(a, b, rel_tol=1e-6) 
+            for a, b in zip(result["predictions"], exp["predictions"])
+        )
+        for result, exp in zip(results, expected)
+    )
+
+    if matched:
+        print("Concurrent inference test passed:", len(results), "requests")
+    else:
+        print("Concurrent inference test failed.")
+
+
 if __name__ == "__main__":
     print("Running health check test...")
     test_check()
@@ -71,3 +150,15 @@ if __name__ == "__main__":
 
     print("\nRunning bad auth test...")
     test_unauthorized()
+
+    print("\nRunning lowercase auth scheme test...")
+    test_lowercase_scheme()
+
+    print("\nRunning missing auth test...")
+    test_missing_auth()
+
+    print("\nRunning ragged input test...")
+    test_ragged_input()
+
+    print("\nRunning concurrent inference test...")
+    test_concurrent_inference()